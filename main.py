@@ -1,41 +1,259 @@
 import re
 import json
 import os
-import time
+import sys
+import socket
+import functools
 from typing import Dict, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 
-import pyperclip
-import requests
+try:
+    import orjson
+except ImportError:  # orjson необязателен, без него используется стандартный json
+    orjson = None
+
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+    
+    # Прототипы WinAPI настраиваются один раз при загрузке модуля
+    _STD_OUTPUT_HANDLE = -11
+    _ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+    _kernel32 = ctypes.WinDLL('kernel32')
+    _kernel32.GetStdHandle.argtypes = [wintypes.DWORD]
+    _kernel32.GetStdHandle.restype = wintypes.HANDLE
+    _kernel32.GetConsoleMode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    _kernel32.GetConsoleMode.restype = wintypes.BOOL
+    _kernel32.SetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _kernel32.SetConsoleMode.restype = wintypes.BOOL
+
+
+# Допустимый URL для отправки сообщений, группа 1 - ID канала (компилируется один раз)
+_URL_RE = re.compile(r'https://discord\.com/api/v\d+/channels/(\d+)/messages')
+
+_WHITESPACE = ' \t\r\n'
+
+# Перемещение курсора в начало, очистка экрана и истории прокрутки
+_CLEAR_SEQUENCE = '\x1b[H\x1b[2J\x1b[3J'
+
+# Ответы пользователя, которые считаются согласием
+_YES_ANSWERS = frozenset(("да", "д", "yes", "y", "1"))
+
+
+@functools.lru_cache(maxsize=1)
+def _httpx() -> Any:
+    """Импортирует httpx при первой отправке, чтобы не замедлять запуск программы."""
+    import httpx
+    return httpx
+
+
+@functools.lru_cache(maxsize=1)
+def _pyperclip() -> Any:
+    """Импортирует pyperclip при первом обращении к буферу обмена."""
+    import pyperclip
+    return pyperclip
+
+
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """Разбирает JSON-строку или байты, используя orjson при его наличии."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Сериализует объект в JSON-строку, используя orjson при его наличии."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+@functools.lru_cache(maxsize=1)
+def _ansi_supported() -> bool:
+    """
+    Проверяет, понимает ли терминал ANSI-последовательности.
+    
+    В Windows 10+ поддержка включается для консоли при первом вызове.
+    """
+    try:
+        if not sys.stdout.isatty():
+            return False
+        if os.name != 'nt':
+            return os.environ.get('TERM', 'dumb') != 'dumb'
+        handle = _kernel32.GetStdHandle(_STD_OUTPUT_HANDLE & 0xFFFFFFFF)
+        mode = wintypes.DWORD()
+        if not _kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(_kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _is_fetch(text: str) -> bool:
+    """Проверяет, начинается ли текст (без учета ведущих пробелов) с fetch-запроса."""
+    index = 0
+    length = len(text)
+    while index < length and text[index] in _WHITESPACE:
+        index += 1
+    return text.startswith("fetch(", index)
+
+
+def _find_value_start(text: str, key: str, pos: int) -> int:
+    """Возвращает индекс начала значения после ключа key или -1, если ключ не найден."""
+    index = text.find(key, pos)
+    if index == -1:
+        return -1
+    index += len(key)
+    while index < len(text) and text[index] in _WHITESPACE:
+        index += 1
+    return index
+
+
+def _find_string_end(text: str, start: int) -> int:
+    """
+    Находит конец строкового литерала, открывающая кавычка которого стоит в позиции start.
+    
+    Переходит между кавычками через str.find, не просматривая строку посимвольно.
+    
+    Returns:
+        Индекс символа, следующего за закрывающей кавычкой, или -1 если строка не завершена
+    """
+    index = start + 1
+    while True:
+        index = text.find('"', index)
+        if index == -1:
+            return -1
+        # Кавычка экранирована, если перед ней нечетное число обратных слэшей
+        backslashes = 0
+        while text[index - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return index + 1
+        index += 1
+
+
+def _find_value_end(text: str, start: int) -> int:
+    """
+    Находит конец JSON-объекта или строки, начинающихся с позиции start.
+    
+    Учитывает вложенные фигурные скобки, а также скобки и кавычки внутри строк.
+    
+    Returns:
+        Индекс символа, следующего за значением, или -1 если значение не завершено
+    """
+    depth = 0
+    index = start
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char == '"':
+            index = _find_string_end(text, index)
+            if index == -1 or depth == 0:
+                return index
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return -1
+
+
+def _extract_fields(text: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Находит в тексте fetch-запроса URL, заголовки и тело за один проход.
+    
+    Args:
+        text: Текст с fetch-запросом
+        
+    Returns:
+        Кортеж (url, headers_text, body_literal) или None, если какое-то поле не найдено:
+        - headers_text: JSON-объект заголовков
+        - body_literal: строковый литерал с JSON телом запроса (вместе с кавычками)
+    """
+    url_start = text.find('fetch("')
+    if url_start == -1:
+        return None
+    url_start += len('fetch("')
+    url_end = text.find('"', url_start)
+    if url_end == -1:
+        return None
+    
+    headers_start = _find_value_start(text, '"headers":', url_end)
+    if headers_start == -1 or not text.startswith('{', headers_start):
+        return None
+    headers_end = _find_value_end(text, headers_start)
+    if headers_end == -1:
+        return None
+    
+    body_start = _find_value_start(text, '"body":', headers_end)
+    if body_start == -1 or not text.startswith('"', body_start):
+        return None
+    body_end = _find_value_end(text, body_start)
+    if body_end == -1:
+        return None
+    
+    return (
+        text[url_start:url_end],
+        text[headers_start:headers_end],
+        text[body_start:body_end]
+    )
 
 
 @dataclass
 class FetchData:
     """Класс для хранения данных fetch-запроса."""
+    # Слоты вместо __dict__ (dataclass(slots=True) доступен только с Python 3.10)
+    __slots__ = ('url', 'headers', 'body', 'original_nonce', 'original_content', 'channel_id',
+                 'headers_json')
+    
     url: str
     headers: Dict[str, str]
     body: Dict[str, Any]
     original_nonce: str
     original_content: str
+    channel_id: str
+    # Заголовки с отступами для fetch-запроса; не меняются, поэтому сериализуются при разборе
+    headers_json: str
 
 
 class MessageEditor:
     """Класс для редактирования сообщений Discord."""
     
+    # Неизменяемые части fetch-запроса, между которыми подставляются
+    # URL, заголовки, referrer и тело запроса
+    _FETCH_TEMPLATE = (
+        'fetch("',
+        '", {\n  "headers": ',
+        ',\n  "referrer": "',
+        '",\n  "referrerPolicy": "strict-origin-when-cross-origin",\n  "body": "',
+        '",\n  "method": "POST",\n  "mode": "cors",\n  "credentials": "include"\n});'
+    )
+    
     def __init__(self):
         self.fetch_data: Optional[FetchData] = None
         self.new_content: str = ""
         self.new_nonce: str = ""
+        
+        # Постоянный HTTP/2-клиент переиспользует одно TLS-соединение между запросами,
+        # создается при первой прямой отправке
+        self._client = None
     
     @staticmethod
     def clear_console() -> None:
-        """Очищает консоль в зависимости от операционной системы."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Очищает консоль ANSI-последовательностью или системной командой."""
+        if _ansi_supported():
+            sys.stdout.write(_CLEAR_SEQUENCE)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     @staticmethod
     def get_clipboard_content() -> str:
         """Получает содержимое буфера обмена."""
-        return pyperclip.paste()
+        return _pyperclip().paste()
     
     def extract_fetch_data(self, fetch_text: str) -> Optional[FetchData]:
         """
@@ -48,30 +266,23 @@ class MessageEditor:
             Объект FetchData с извлеченными данными или None в случае ошибки
         """
         try:
-            # Извлекаем URL
-            url_match = re.search(r'fetch\("(https://discord\.com/api/v\d+/channels/\d+/messages)"', fetch_text)
-            if not url_match:
+            # Находим URL, заголовки и тело запроса
+            fields = _extract_fields(fetch_text)
+            if not fields:
                 return None
-            url = url_match.group(1)
+            url, headers_text, body_literal = fields
             
-            # Извлекаем заголовки
-            headers_match = re.search(r'"headers":\s*({[^}]+})', fetch_text)
-            if not headers_match:
+            url_match = _URL_RE.fullmatch(url)
+            if not url_match:
                 return None
             
-            headers_text = headers_match.group(1).replace("'", '"')
-            headers = json.loads(headers_text)
+            headers = _json_loads(headers_text.replace("'", '"'))
             
-            # Извлекаем тело запроса
-            body_match = re.search(r'"body":\s*"({[^}]+})"', fetch_text)
-            if not body_match:
-                return None
-            
-            body_text = body_match.group(1).replace('\\"', '"')
-            body = json.loads(body_text)
+            # Тело запроса - JSON, упакованный в строковый литерал
+            body = _json_loads(_json_loads(body_literal))
             
             # Проверяем наличие nonce в теле запроса
-            if "nonce" not in body:
+            if not isinstance(body, dict) or "nonce" not in body:
                 return None
             
             return FetchData(
@@ -79,7 +290,9 @@ class MessageEditor:
                 headers=headers,
                 body=body,
                 original_nonce=body["nonce"],
-                original_content=body.get("content", "")
+                original_content=body.get("content", ""),
+                channel_id=url_match.group(1),
+                headers_json=_json_dumps(headers, indent=True)
             )
         except Exception as e:
             print(f"❌ Ошибка при извлечении данных: {e}")
@@ -92,7 +305,7 @@ class MessageEditor:
         Returns:
             Кортеж (fetch_request, request_data):
             - fetch_request: готовый fetch-запрос для вставки в консоль браузера
-            - request_data: данные для прямого запроса через библиотеку requests
+            - request_data: данные для прямого запроса через библиотеку httpx
         """
         if not self.fetch_data:
             raise ValueError("Fetch data not initialized")
@@ -103,24 +316,24 @@ class MessageEditor:
         new_body["nonce"] = self.new_nonce
         
         # Подготавливаем данные для запроса
-        body_json = json.dumps(new_body)
-        body_escaped = body_json.replace('"', '\\"')
-        headers_json = json.dumps(self.fetch_data.headers, indent=2)
+        body_json = _json_dumps(new_body)
+        # Повторная сериализация экранирует кавычки, слэши и переносы строк для JS-строки
+        body_escaped = _json_dumps(body_json)[1:-1]
+        headers_json = self.fetch_data.headers_json
         url = self.fetch_data.url
         referrer = self.fetch_data.headers.get('referer', 'https://discord.com/channels/@me')
         
         # Формируем fetch-запрос для браузера
-        fetch_request = f'''fetch("{url}", {{
-  "headers": {headers_json},
-  "referrer": "{referrer}",
-  "referrerPolicy": "strict-origin-when-cross-origin",
-  "body": "{body_escaped}",
-  "method": "POST",
-  "mode": "cors",
-  "credentials": "include"
-}});'''
-        
-        # Данные для прямого запроса через requests
+        parts = self._FETCH_TEMPLATE
+        fetch_request = "".join((
+            parts[0], url,
+            parts[1], headers_json,
+            parts[2], referrer,
+            parts[3], body_escaped,
+            parts[4]
+        ))
+        
+        # Данные для прямого запроса через httpx
         request_data = {
             "url": url,
             "headers": self.fetch_data.headers,
@@ -129,10 +342,9 @@ class MessageEditor:
         
         return fetch_request, request_data
     
-    @staticmethod
-    def send_request_directly(request_data: Dict[str, Any]) -> Tuple[bool, Union[Dict[str, Any], str]]:
+    def send_request_directly(self, request_data: Dict[str, Any]) -> Tuple[bool, Union[Dict[str, Any], str]]:
         """
-        Отправляет запрос напрямую через библиотеку requests.
+        Отправляет запрос напрямую через библиотеку httpx.
         
         Args:
             request_data: Данные для запроса
@@ -143,23 +355,43 @@ class MessageEditor:
             - response_data: в случае успеха - данные ответа, иначе - текст ошибки
         """
         try:
-            response = requests.post(
+            httpx = _httpx()
+            if self._client is None:
+                # TCP_NODELAY: небольшие запросы уходят сразу, без задержки алгоритма Нейгла
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+                )
+                self._client = httpx.Client(transport=transport, timeout=10)
+            
+            # Куки от предыдущих ответов не должны связывать между собой отправки,
+            # в том числе сделанные с разных аккаунтов
+            self._client.cookies.clear()
+            
+            response = self._client.post(
                 request_data["url"],
                 headers=request_data["headers"],
-                json=request_data["json"],
-                timeout=10
+                json=request_data["json"]
             )
             
             if response.status_code == 200:
-                return True, response.json()
+                return True, _json_loads(response.content)
             else:
                 return False, f"Код ответа: {response.status_code}, Сообщение: {response.text}"
         
-        except requests.RequestException as e:
+        except ImportError as e:
+            return False, f"Не установлены зависимости для прямой отправки: {str(e)}"
+        except httpx.HTTPError as e:
             return False, f"Ошибка сети при отправке запроса: {str(e)}"
         except Exception as e:
             return False, f"Непредвиденная ошибка: {str(e)}"
     
+    def close(self) -> None:
+        """Закрывает HTTP-клиент, если он был создан."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
     def show_welcome_message(self) -> None:
         """Отображает приветственное сообщение и инструкции."""
         self.clear_console()
@@ -187,14 +419,14 @@ class MessageEditor:
         attempts = 0
         max_attempts = 3
         
-        while not clipboard_content.strip().startswith("fetch(") and attempts < max_attempts:
+        while not _is_fetch(clipboard_content) and attempts < max_attempts:
             attempts += 1
             print("❌ В буфере обмена не найден fetch-запрос!")
             print(f"Попытка {attempts}/{max_attempts}. Скопируйте запрос из DevTools и повторите.")
             input("Нажмите Enter, когда fetch-запрос будет скопирован... ")
             clipboard_content = self.get_clipboard_content()
         
-        if not clipboard_content.strip().startswith("fetch("):
+        if not _is_fetch(clipboard_content):
             print("❌ В буфере обмена не найден fetch-запрос после нескольких попыток.")
             print("Убедитесь, что вы копируете правильный запрос. Программа завершает работу.")
             return False
@@ -250,7 +482,7 @@ class MessageEditor:
         
         Args:
             fetch_request: Подготовленный fetch-запрос для вставки в консоль
-            request_data: Данные для прямого запроса через requests
+            request_data: Данные для прямого запроса через httpx
             
         Returns:
             bool: True если пользователь хочет продолжить работу, False для завершения
@@ -269,7 +501,7 @@ class MessageEditor:
             print("Вы можете вставить его в консоль DevTools (F12) на странице Discord.")
             
             restart_choice = input("\nПродолжить работу с другим сообщением? (да/нет): ")
-            return restart_choice.lower() in ["да", "д", "yes", "y", "1"]
+            return restart_choice.lower() in _YES_ANSWERS
         
         elif choice == "3":
             print("Выход без отправки. Программа завершена!")
@@ -278,11 +510,11 @@ class MessageEditor:
         else:
             print("Некорректный выбор.")
             restart_choice = input("\nПродолжить работу с другим сообщением? (да/нет): ")
-            return restart_choice.lower() in ["да", "д", "yes", "y", "1"]
+            return restart_choice.lower() in _YES_ANSWERS
     
     def handle_direct_request(self, request_data: Dict[str, Any]) -> bool:
         """
-        Обрабатывает прямую отправку запроса через requests.
+        Обрабатывает прямую отправку запроса через httpx.
         
         Args:
             request_data: Данные для запроса
@@ -296,7 +528,7 @@ class MessageEditor:
         if success:
             print("✅ Сообщение успешно отправлено!")
             message_id = response.get("id", "неизвестно")
-            channel_id = request_data["url"].split("/")[-2]
+            channel_id = self.fetch_data.channel_id
             print(f"ID сообщения: {message_id}")
             print(f"Ссылка на сообщение: https://discord.com/channels/@me/{channel_id}/{message_id}")
             
@@ -311,7 +543,7 @@ class MessageEditor:
             print("Вы всё ещё можете использовать скопированный fetch-запрос в консоли браузера.")
             
             retry_choice = input("\nХотите попробовать снова с другим сообщением? (да/нет): ")
-            return retry_choice.lower() in ["да", "д", "yes", "y", "1"]
+            return retry_choice.lower() in _YES_ANSWERS
     
     def process_message(self) -> bool:
         """
@@ -323,18 +555,18 @@ class MessageEditor:
         # Получаем данные из fetch-запроса
         if not self.get_fetch_request():
             retry_choice = input("\nХотите попробовать снова? (да/нет): ")
-            return retry_choice.lower() in ["да", "д", "yes", "y", "1"]
+            return retry_choice.lower() in _YES_ANSWERS
         
         # Получаем новый текст и nonce
         if not self.get_new_content_and_nonce():
             retry_choice = input("\nХотите попробовать снова? (да/нет): ")
-            return retry_choice.lower() in ["да", "д", "yes", "y", "1"]
+            return retry_choice.lower() in _YES_ANSWERS
         
         # Формируем новый запрос
         fetch_request, request_data = self.edit_message_without_mark()
         
         # Копируем fetch-запрос в буфер обмена
-        pyperclip.copy(fetch_request)
+        _pyperclip().copy(fetch_request)
         
         print("=" * 60)
         print("✅ Новый fetch-запрос скопирован в буфер обмена!")
@@ -344,24 +576,21 @@ class MessageEditor:
 
 def main() -> None:
     """Основная функция программы."""
+    editor = MessageEditor()
     try:
-        editor = MessageEditor()
         continue_running = True
         
         while continue_running:
             editor.show_welcome_message()
             continue_running = editor.process_message()
-            
-            if continue_running:
-                print("\nПодготовка к обработке следующего сообщения...")
-                time.sleep(1.5)
-                editor.clear_console()
     
     except KeyboardInterrupt:
         print("\nПрограмма прервана пользователем.")
     except Exception as e:
         print(f"\nПроизошла непредвиденная ошибка: {e}")
         input("Нажмите Enter для выхода...")
+    finally:
+        editor.close()
 
 
 if __name__ == "__main__":